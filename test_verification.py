@@ -7,21 +7,24 @@ and data based on the test XML file.
 """
 
 import csv
+import importlib.util
 import sys
 from pathlib import Path
 
+# Load the parser from source, as 'make test' runs it, so that a native
+# extension built by 'make cython' cannot shadow it during verification
+_spec = importlib.util.spec_from_file_location(
+    "cppcheck_parser", Path(__file__).resolve().with_name("cppcheck_parser.py"))
+cppcheck_parser = importlib.util.module_from_spec(_spec)
+sys.modules["cppcheck_parser"] = cppcheck_parser  # worker processes resolve functions by module name
+_spec.loader.exec_module(cppcheck_parser)
+
 def load_csv_data(csv_file):
     """Load CSV data and return as a dictionary."""
-    data = {}
     with open(csv_file, 'r', newline='', encoding='utf-8') as f:
         reader = csv.reader(f)
-        header = next(reader)  # Skip header
-        for row in reader:
-            if len(row) >= 2:
-                count = int(row[0])
-                key = row[1]
-                data[key] = count
-    return data
+        next(reader)  # Skip header
+        return {row[1]: int(row[0]) for row in reader if len(row) >= 2}
 
 def verify_all_errors_csv(csv_file):
     """Verify the all errors CSV file."""
@@ -36,7 +39,8 @@ def verify_all_errors_csv(csv_file):
         'doubleFree': 1,
         'uninitDerivedMemberVar': 1,
         'dupInheritedMember': 1,
-        'unusedFunction': 2
+        'unusedFunction': 2,
+        'invalidPrintfArgType_sint': 1
     }
     
     errors = []
@@ -67,7 +71,7 @@ def verify_severities_csv(csv_file):
     
     expected = {
         'error': 10,
-        'warning': 1,
+        'warning': 2,
         'style': 2
     }
     
@@ -127,6 +131,63 @@ def verify_error_severity_only_csv(csv_file):
         print("✅ Error Severity Only CSV verification passed")
         return True
 
+def verify_html_escaping(xml_file, output_dir):
+    """Verify that markup characters from the XML are escaped in the HTML report."""
+    print("Verifying HTML escaping...")
+    html_file = output_dir / "escape_check.html"
+    cppcheck_parser.write_html_report(xml_file, html_file)
+    html = html_file.read_text(encoding='utf-8')
+    
+    expected = [
+        "std::vector&lt;int&gt;",
+        "&amp; the call passes &quot;items&quot; instead.",
+        "Argument &lt;b&gt;items&lt;/b&gt; &amp; format defined here",
+    ]
+    unexpected = [
+        "std::vector<int>",
+        "<b>items</b>",
+        '"items"',
+    ]
+    
+    errors = []
+    for text in expected:
+        if text not in html:
+            errors.append(f"Missing escaped text: {text}")
+    for text in unexpected:
+        if text in html:
+            errors.append(f"Unescaped markup in report: {text}")
+    
+    if errors:
+        print("❌ HTML escaping verification failed:")
+        for error in errors:
+            print(f"  - {error}")
+        return False
+    else:
+        print("✅ HTML escaping verification passed")
+        return True
+
+def verify_parallel_html_report(xml_file, output_dir):
+    """Verify that parallel HTML rendering matches the in-process output."""
+    print("Verifying parallel HTML rendering...")
+    serial_file = output_dir / "parallel_check_serial.html"
+    parallel_file = output_dir / "parallel_check_parallel.html"
+    
+    # Render the sample both ways; the pool is opt-in so it needs an explicit request
+    github_url = "https://github.com/haumont/cppcheck-analyzer/blob/main"
+    cppcheck_parser.write_html_report(xml_file, serial_file, github_url=github_url, parallel=False)
+    cppcheck_parser.write_html_report(xml_file, parallel_file, github_url=github_url, parallel=True)
+    
+    serial_html = serial_file.read_text(encoding='utf-8')
+    parallel_html = parallel_file.read_text(encoding='utf-8')
+    
+    if not serial_html or serial_html != parallel_html:
+        print("❌ Parallel HTML rendering verification failed:")
+        print("  - Parallel report differs from in-process report")
+        return False
+    else:
+        print("✅ Parallel HTML rendering verification passed")
+        return True
+
 def main():
     """Main verification function."""
     output_dir = Path("test/output")
@@ -163,6 +224,9 @@ def main():
     else:
         success &= verify_error_severity_only_csv(error_only_file)
     
+    success &= verify_html_escaping(Path("test/sample_cppcheck.xml"), output_dir)
+    success &= verify_parallel_html_report(Path("test/sample_cppcheck.xml"), output_dir)
+    
     print("=" * 50)
     if success:
         print("🎉 ALL VERIFICATION TESTS PASSED!")
@@ -173,7 +237,7 @@ def main():
         print("  - unusedFunction: 2")
         print("  - error severity: 10")
         print("  - style severity: 2")
-        print("  - warning severity: 1")
+        print("  - warning severity: 2")
     else:
         print("❌ SOME VERIFICATION TESTS FAILED!")
         sys.exit(1)